@@ -37,6 +37,7 @@ Additional features include:
 - Excel export with color-coded highlighting  
 - Interactive preview with row filtering  
 - Duplicate row merging  
+- Timeline mode to track changes across many snapshots at once  
         """
     )
 
@@ -6,6 +6,7 @@ import os
 import traceback
 from openpyxl import load_workbook
 from openpyxl.styles import PatternFill
+from utils import read_file_to_df
 
 
 # STREAMLIT CONFIG =========================
@@ -21,56 +22,6 @@ st.markdown("Utility to compare two tabular files and review their differences."
 
 # FUNCTIONS =========================
 
-def read_file_to_df(uploaded_or_path):
-    """Read an uploaded file or a file path into a cleaned pandas DataFrame."""
-    try:
-        if isinstance(uploaded_or_path, str):
-            path = uploaded_or_path
-            ext = os.path.splitext(path)[1].lower()
-            if ext in [".csv", ".txt"]:
-                df = pd.read_csv(path, sep=None, engine="python", dtype=str)
-            else:
-                df = pd.read_excel(path, sheet_name=0, dtype=str)
-        else:
-            uploaded = uploaded_or_path
-            name = getattr(uploaded, "name", "") or ""
-            ext = os.path.splitext(name)[1].lower()
-            uploaded_file_buffer = uploaded.getvalue()
-
-            if ext in [".csv", ".txt"]:
-                try:
-                    df = pd.read_csv(
-                        io.BytesIO(uploaded_file_buffer),
-                        sep=None,
-                        engine="python",
-                        dtype=str,
-                    )
-                except Exception:
-                    df = pd.read_csv(
-                        io.BytesIO(uploaded_file_buffer),
-                        dtype=str,
-                        engine="python",
-                        sep=",",
-                        on_bad_lines="skip",
-                    )
-            else:
-                df = pd.read_excel(
-                    io.BytesIO(uploaded_file_buffer),
-                    sheet_name=0,
-                    dtype=str,
-                )
-
-        df = df.fillna("").astype(str).apply(lambda x: x.str.strip())
-        df = df.replace({"nan": "", "NaN": "", "None": ""})
-        df.columns = df.columns.str.strip().str.replace(r"[\r\n]+", "", regex=True)
-        return df
-
-    except Exception as e:
-        st.error(f"Error while reading file: {e}")
-        st.exception(e)
-        raise
-
-
 def apply_excel_coloring(df_export, file_path):
 
     try:
@@ -0,0 +1,401 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import io
+import datetime
+import traceback
+from openpyxl.styles import PatternFill
+from utils import read_file_to_df
+
+
+# STREAMLIT CONFIG =========================
+
+st.set_page_config(
+    page_title="Timeline Comparison Tool",
+    page_icon="🕒",
+    layout="wide",
+)
+st.title("🕒 Timeline Comparison Tool")
+st.markdown("Utility to track how rows change across several snapshots of the same table.")
+
+
+# FUNCTIONS =========================
+
+TIMELINE_RESERVED_COLS = ["Version", "Status", "StatusBadge", "Changed Columns"]
+
+
+def build_row_index(snapshots, key_col, is_case_insensitive_key):
+    """Factorize the key of every snapshot into one shared row index.
+
+    Rows sharing a key are told apart by their occurrence number, the same way
+    the pairwise comparison pairs them with ``_row_id``. Returns one array of
+    row ids per snapshot plus the occurrence of each id.
+    """
+    norm_keys = []
+    occurrences = []
+    for df in snapshots:
+        keys = df[key_col].str.upper() if is_case_insensitive_key else df[key_col]
+        norm_keys.append(keys)
+        occurrences.append(keys.groupby(keys).cumcount().to_numpy(dtype=np.int64))
+
+    key_codes, _ = pd.factorize(pd.concat(norm_keys, ignore_index=True))
+    all_occurrences = np.concatenate(occurrences)
+    occurrence_span = int(all_occurrences.max()) + 1 if len(all_occurrences) else 1
+
+    row_codes, row_uniques = pd.factorize(key_codes.astype(np.int64) * occurrence_span + all_occurrences)
+    row_occurrence = np.asarray(row_uniques, dtype=np.int64) % occurrence_span
+
+    row_ids_per_snapshot = np.split(row_codes, np.cumsum([len(df) for df in snapshots])[:-1])
+    return row_ids_per_snapshot, row_occurrence
+
+
+def run_timeline(snapshots, labels, selected_key_col_name):
+    """Build the change history of every key across an ordered list of snapshots."""
+    if len(snapshots) < 2:
+        st.error("At least two snapshots are required for a timeline.")
+        return False
+
+    for label, df in zip(labels, snapshots):
+        if df.empty or df.columns.empty:
+            st.error(f"Snapshot '{label}' is empty or could not be read.")
+            return False
+
+    common_cols = [
+        col for col in snapshots[0].columns if all(col in df.columns for df in snapshots[1:])
+    ]
+    if not common_cols:
+        st.error("No columns are shared by all snapshots.")
+        return False
+
+    renamed_cols = {
+        col: f"{col} (data)" for col in common_cols if col in TIMELINE_RESERVED_COLS
+    }
+    if renamed_cols:
+        st.warning(
+            "Some columns clash with the timeline's own columns and were renamed: "
+            + ", ".join(f"'{old}' → '{new}'" for old, new in renamed_cols.items())
+        )
+        snapshots = [df.rename(columns=renamed_cols) for df in snapshots]
+        common_cols = [renamed_cols.get(col, col) for col in common_cols]
+        selected_key_col_name = renamed_cols.get(selected_key_col_name, selected_key_col_name)
+
+    if selected_key_col_name in common_cols:
+        st.info(f"Using '{selected_key_col_name}' as the case-insensitive key column.")
+        key_col = selected_key_col_name
+        is_case_insensitive_key = True
+    else:
+        key_col = common_cols[0]
+        st.warning(
+            f"Key column '{selected_key_col_name}' was not found in all snapshots. "
+            f"Falling back to the first shared column '{key_col}' (case-sensitive)."
+        )
+        is_case_insensitive_key = False
+
+    value_cols = [col for col in common_cols if col != key_col]
+    snapshots = [df[common_cols].astype(str).reset_index(drop=True) for df in snapshots]
+
+    row_ids_per_snapshot, row_occurrence = build_row_index(snapshots, key_col, is_case_insensitive_key)
+    n_snapshots = len(snapshots)
+    n_rows = len(row_occurrence)
+
+    # One fingerprint per row and snapshot; a row is modified when its
+    # fingerprint differs between two consecutive snapshots.
+    present = np.zeros((n_snapshots, n_rows), dtype=bool)
+    fingerprints = np.zeros((n_snapshots, n_rows), dtype=np.uint64)
+    positions = np.full((n_snapshots, n_rows), -1, dtype=np.int64)
+
+    for v, (df, row_ids) in enumerate(zip(snapshots, row_ids_per_snapshot)):
+        present[v, row_ids] = True
+        positions[v, row_ids] = np.arange(len(df))
+        if value_cols:
+            fingerprints[v, row_ids] = pd.util.hash_pandas_object(df[value_cols], index=False).to_numpy()
+
+    event_frames = []
+
+    def collect_events(source_v, row_ids, status, changed_cols=None, event_v=None):
+        if len(row_ids) == 0:
+            return
+        event_v = source_v if event_v is None else event_v
+        rows = snapshots[source_v].iloc[positions[source_v, row_ids]].reset_index(drop=True)
+        rows.insert(0, "Status", status)
+        rows.insert(0, "Version", labels[event_v])
+        rows["_changed_cols"] = changed_cols if changed_cols is not None else ""
+        rows["_row_id"] = row_ids
+        rows["_version_idx"] = event_v
+        event_frames.append(rows)
+
+    collect_events(0, np.flatnonzero(present[0]), "Initial")
+
+    modified_counts = np.zeros(n_rows, dtype=np.int64)
+    summary_records = [{
+        "Version": labels[0],
+        "Rows": len(snapshots[0]),
+        "Added": 0,
+        "Modified": 0,
+        "Deleted": 0,
+    }]
+
+    for v in range(1, n_snapshots):
+        prev_present = present[v - 1]
+        cur_present = present[v]
+
+        added_ids = np.flatnonzero(cur_present & ~prev_present)
+        deleted_ids = np.flatnonzero(prev_present & ~cur_present)
+        modified_ids = np.flatnonzero(
+            prev_present & cur_present & (fingerprints[v - 1] != fingerprints[v])
+        )
+
+        changed_cols = []
+        if len(modified_ids):
+            old_values = snapshots[v - 1][value_cols].to_numpy()[positions[v - 1, modified_ids]]
+            new_values = snapshots[v][value_cols].to_numpy()[positions[v, modified_ids]]
+            value_cols_arr = np.array(value_cols, dtype=object)
+            changed_cols = [",".join(value_cols_arr[diff]) for diff in old_values != new_values]
+
+        collect_events(v, added_ids, "Added")
+        collect_events(v, modified_ids, "Modified", changed_cols)
+        # Deleted rows carry their last known values but belong to the version they vanished in.
+        collect_events(v - 1, deleted_ids, "Deleted", event_v=v)
+
+        modified_counts[modified_ids] += 1
+        summary_records.append({
+            "Version": labels[v],
+            "Rows": len(snapshots[v]),
+            "Added": len(added_ids),
+            "Modified": len(modified_ids),
+            "Deleted": len(deleted_ids),
+        })
+
+    events_df = pd.concat(event_frames, ignore_index=True)
+    events_df = events_df.sort_values(by=["_row_id", "_version_idx"], kind="stable")
+    events_df = events_df.drop(columns=["_row_id", "_version_idx"]).reset_index(drop=True)
+
+    first_seen = present.argmax(axis=0)
+    last_seen = n_snapshots - 1 - present[::-1].argmax(axis=0)
+    label_arr = np.array(labels, dtype=object)
+    key_values = np.empty(n_rows, dtype=object)
+    for v in range(n_snapshots):
+        key_values[row_ids_per_snapshot[v]] = snapshots[v][key_col].to_numpy()
+
+    history_df = pd.DataFrame({
+        key_col: key_values,
+        "First Seen": label_arr[first_seen],
+        "Last Seen": label_arr[last_seen],
+        "Times Modified": modified_counts,
+        "Current Status": np.where(present[-1], "Present", "Deleted"),
+    })
+    if int(row_occurrence.max()) > 0:
+        history_df.insert(1, "Occurrence", row_occurrence + 1)
+
+    st.session_state["timeline_events_df"] = events_df
+    st.session_state["timeline_history_df"] = history_df
+    st.session_state["timeline_summary_df"] = pd.DataFrame(summary_records)
+    st.session_state["timeline_key_col"] = key_col
+    st.success(f"Timeline built across {n_snapshots} snapshots.")
+    return True
+
+
+def build_timeline_workbook(events_df, history_df, summary_df):
+    """Write the timeline result to an in-memory Excel workbook with colored events."""
+    fill_by_status = {
+        "Added": PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+        "Deleted": PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"),
+        "Modified": PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid"),
+    }
+    fill_yellow_bright = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        events_visible = events_df.drop(columns=["_changed_cols"], errors="ignore")
+        events_visible.to_excel(writer, sheet_name="Timeline", index=False)
+        history_df.to_excel(writer, sheet_name="Key History", index=False)
+        summary_df.to_excel(writer, sheet_name="Version Summary", index=False)
+
+        ws = writer.sheets["Timeline"]
+        header_to_idx = {h: i + 1 for i, h in enumerate(events_visible.columns)}
+
+        for r_idx, (status, changed_cols_str) in enumerate(
+            zip(events_df["Status"], events_df["_changed_cols"])
+        ):
+            fill = fill_by_status.get(status)
+            if fill is None:
+                continue
+            r = r_idx + 2
+            for c in range(1, ws.max_column + 1):
+                ws.cell(row=r, column=c).fill = fill
+            if status == "Modified":
+                for colname in [c for c in changed_cols_str.split(",") if c]:
+                    if colname in header_to_idx:
+                        ws.cell(row=r, column=header_to_idx[colname]).fill = fill_yellow_bright
+
+    buffer.seek(0)
+    return buffer.getvalue()
+
+
+# SESSION STATE INIT =========================
+
+for key, val in [
+    ("timeline_snapshots_raw", None),
+    ("timeline_labels", None),
+    ("timeline_selected_key_col", None),
+    ("timeline_events_df", None),
+    ("timeline_history_df", None),
+    ("timeline_summary_df", None),
+    ("timeline_key_col", None),
+    ("timeline_active_status", "All"),
+    ("timeline_download_data", None),
+]:
+    if key not in st.session_state:
+        st.session_state[key] = val
+
+
+# MAIN UI =========================
+
+with st.container(border=True):
+    st.subheader("1. Upload Snapshots")
+
+    files = st.file_uploader(
+        "Snapshot Files (CSV/XLSX/XLSM)",
+        type=["csv", "xlsx", "xlsm"],
+        accept_multiple_files=True,
+        key="timeline_files",
+    )
+    st.caption("Snapshots are ordered by file name, so date-stamped names (e.g. assets_2024-01-31.csv) sort naturally.")
+
+    if st.button("Load Snapshots & Select Key Column", use_container_width=True, type="primary"):
+        if files and len(files) >= 2:
+            try:
+                ordered_files = sorted(files, key=lambda f: f.name)
+                st.session_state["timeline_snapshots_raw"] = [read_file_to_df(f) for f in ordered_files]
+                st.session_state["timeline_labels"] = [f.name for f in ordered_files]
+                st.session_state["timeline_events_df"] = None
+                st.session_state["timeline_selected_key_col"] = None
+                st.success(f"{len(ordered_files)} snapshots loaded successfully. Please select a key column.")
+            except Exception as e:
+                st.error(f"Error while loading snapshots: {e}")
+                traceback.print_exc()
+        else:
+            st.warning("Please upload at least two snapshot files before proceeding.")
+
+if st.session_state["timeline_snapshots_raw"] is not None:
+    st.markdown("---")
+    st.subheader("2. Select Key Column & Build Timeline")
+
+    snapshots_temp = st.session_state["timeline_snapshots_raw"]
+    labels_temp = st.session_state["timeline_labels"]
+    st.markdown("**Snapshot order:** " + " → ".join(labels_temp))
+
+    common_cols = [
+        col for col in snapshots_temp[0].columns if all(col in df.columns for df in snapshots_temp[1:])
+    ]
+
+    if not common_cols:
+        st.error("No columns are shared by all snapshots.")
+    else:
+        default_index = 0
+        if st.session_state["timeline_selected_key_col"] in common_cols:
+            default_index = common_cols.index(st.session_state["timeline_selected_key_col"])
+
+        selected_key_col_name = st.selectbox(
+            "Key column for comparison:",
+            options=common_cols,
+            index=default_index,
+            key="timeline_key_col_selector",
+        )
+        st.session_state["timeline_selected_key_col"] = selected_key_col_name
+
+        if st.button("Build Timeline", use_container_width=True, type="primary", key="build_timeline_button"):
+            try:
+                st.session_state["timeline_download_data"] = None
+                run_timeline(snapshots_temp, labels_temp, selected_key_col_name)
+                st.session_state["timeline_active_status"] = "All"
+            except Exception as e:
+                st.error(f"Error while building timeline: {e}")
+                traceback.print_exc()
+
+if st.session_state["timeline_events_df"] is not None:
+    st.subheader("3. Timeline Review")
+
+    events_cached = st.session_state["timeline_events_df"]
+    history_cached = st.session_state["timeline_history_df"]
+    summary_cached = st.session_state["timeline_summary_df"]
+    key_col = st.session_state["timeline_key_col"]
+
+    st.markdown("**Changes per Version**")
+    st.dataframe(summary_cached, hide_index=True, use_container_width=True)
+
+    changes = events_cached[events_cached["Status"] != "Initial"]
+    status_options = ["All", "Added", "Modified", "Deleted"]
+    tab_names = [
+        f"All ({len(changes)})",
+        f"Added (🟩 {int((changes['Status'] == 'Added').sum())})",
+        f"Modified (🟨 {int((changes['Status'] == 'Modified').sum())})",
+        f"Deleted (🟥 {int((changes['Status'] == 'Deleted').sum())})",
+    ]
+
+    current_status_string = st.session_state["timeline_active_status"]
+    col_tab_buttons = st.columns(len(status_options))
+
+    for i, col in enumerate(col_tab_buttons):
+        is_active = status_options[i] == current_status_string
+        with col:
+            if st.button(
+                tab_names[i],
+                key=f"timeline_tab_btn_{i}",
+                use_container_width=True,
+                type="primary" if is_active else "secondary",
+            ):
+                st.session_state["timeline_active_status"] = status_options[i]
+                st.rerun()
+
+    key_filter = st.text_input(f"Filter by {key_col} (optional):", key="timeline_key_filter").strip()
+
+    df_preview = changes
+    if current_status_string != "All":
+        df_preview = df_preview[df_preview["Status"] == current_status_string]
+    if key_filter:
+        df_preview = df_preview[df_preview[key_col].str.upper() == key_filter.upper()]
+
+    status_emoji = {
+        "Added": "🟩",
+        "Modified": "🟨",
+        "Deleted": "🟥",
+    }
+    df_display = df_preview.copy()
+    df_display.insert(0, "StatusBadge", df_display["Status"].map(status_emoji).fillna("⬜"))
+    df_display = df_display.rename(columns={"_changed_cols": "Changed Columns"})
+
+    st.info(f"Displaying {len(df_display)} events with status: {current_status_string}")
+    st.dataframe(
+        df_display,
+        column_config={"StatusBadge": st.column_config.TextColumn("")},
+        hide_index=True,
+        use_container_width=True,
+        height=400,
+    )
+
+    st.markdown("**History per Key**")
+    history_preview = history_cached
+    if key_filter:
+        history_preview = history_preview[history_preview[key_col].str.upper() == key_filter.upper()]
+    st.dataframe(history_preview, hide_index=True, use_container_width=True, height=300)
+
+    st.markdown("---")
+    st.subheader("Export Timeline")
+    if st.button("Prepare Colored Timeline", type="primary", key="btn_prepare_timeline", use_container_width=True):
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        st.session_state["timeline_download_data"] = {
+            "data": build_timeline_workbook(events_cached, history_cached, summary_cached),
+            "filename": f"OUTPUT_TIMELINE_{timestamp}.xlsx",
+        }
+
+    data = st.session_state["timeline_download_data"]
+    if data:
+        st.download_button(
+            label="Download Colored Timeline",
+            data=data["data"],
+            file_name=data["filename"],
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key="timeline_download",
+            use_container_width=True,
+        )